@@ -1,5 +1,6 @@
 import asyncio
 from datetime import datetime
+from typing import Self
 
 from chatkit.types import ClientToolCallItem, ThreadItemDoneEvent, ThreadMetadata, ThreadStreamEvent, WidgetItem
 from chatkit.widgets import WidgetRoot
@@ -64,6 +65,19 @@ class ADKAgentContext(ADKContext):
 class ChatkitRunConfig(RunConfig):
     context: ADKAgentContext
 
+    @classmethod
+    def from_tool_context(cls, tool_context: ToolContext) -> Self | None:
+        """Return the run config of the tool's invocation, or None when it is not a ChatkitRunConfig."""
+        run_config = tool_context._invocation_context.run_config
+        return run_config if isinstance(run_config, cls) else None
+
+
+def _require_chatkit_run_config(tool_context: ToolContext) -> ChatkitRunConfig:
+    chatkit_run_config = ChatkitRunConfig.from_tool_context(tool_context)
+    if chatkit_run_config is None:
+        raise ValueError("Make sure to set run_config for runner to ChatkitRunConfig")
+    return chatkit_run_config
+
 
 async def stream_event(event: ThreadStreamEvent, tool_context: ToolContext) -> None:
     """Stream an event to the chat interface.
@@ -72,9 +86,7 @@ async def stream_event(event: ThreadStreamEvent, tool_context: ToolContext) -> N
         event: The event to stream.
         tool_context: The tool context associated with the event.
     """
-    chatkit_run_config = tool_context._invocation_context.run_config
-    if not isinstance(chatkit_run_config, ChatkitRunConfig):
-        raise ValueError("Make sure to set run_config for runner to ChatkitRunConfig")
+    chatkit_run_config = _require_chatkit_run_config(tool_context)
 
     await chatkit_run_config.context.stream(event)
 
@@ -86,9 +98,7 @@ async def stream_widget(widget: WidgetRoot, tool_context: ToolContext) -> None:
         widget: The widget to stream.
         tool_context: The tool context associated with the widget.
     """
-    chatkit_run_config = tool_context._invocation_context.run_config
-    if not isinstance(chatkit_run_config, ChatkitRunConfig):
-        raise ValueError("Make sure to set run_config for runner to ChatkitRunConfig")
+    chatkit_run_config = _require_chatkit_run_config(tool_context)
 
     await chatkit_run_config.context.stream_widget(widget, tool_context)
 
@@ -103,8 +113,6 @@ async def issue_client_tool_call(
         client_tool_call: The client tool call state to issue.
         tool_context: The tool context associated with the client tool call.
     """
-    chatkit_run_config = tool_context._invocation_context.run_config
-    if not isinstance(chatkit_run_config, ChatkitRunConfig):
-        raise ValueError("Make sure to set run_config for runner to ChatkitRunConfig")
+    chatkit_run_config = _require_chatkit_run_config(tool_context)
 
     await chatkit_run_config.context.issue_client_tool_call(client_tool_call, tool_context)
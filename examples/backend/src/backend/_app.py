@@ -6,6 +6,7 @@ import fastapi
 from fastapi import FastAPI
 from google.adk.runners import Runner
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 
 from ._config import Settings
 from ._runner_manager import RunnerManager
@@ -45,6 +46,9 @@ class App(fastapi.FastAPI):
             lifespan=lifespan,
         )
 
+        # Starlette leaves text/event-stream responses uncompressed, so chatkit streams still flush per event
+        self.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
         if settings.all_cors_origins:
             self.add_middleware(
                 CORSMiddleware,
@@ -1,13 +1,16 @@
 import os
 from enum import Enum
 from pathlib import Path
-from typing import Annotated, Any, Literal
+from typing import Annotated, Any, Final, Literal
 
 from pydantic import AnyUrl, BaseModel, BeforeValidator, SecretStr, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .agents._config import AgentConfig
 
+# Authentication is not wired up yet, so every request acts as this user
+DEFAULT_USER_ID: Final[str] = "ksachdeva-1"
+
 
 class EmbeddingModelType(str, Enum):
     openai = "openai"
@@ -80,6 +83,9 @@ class Settings(BaseSettings):
     CAT_APP_NAME: str = "cat"
     NEWS_APP_NAME: str = "news"
 
+    # Artificial pause before the widgets demo renders its tasks widget, to show the progress update
+    WIDGETS_RENDER_DELAY_SECONDS: float = 0.0
+
     DATA_DIR: Path
 
     SESSION_STORAGE_TYPE: SessionStorageType = SessionStorageType.memory
@@ -1,5 +1,4 @@
 from collections.abc import AsyncIterator
-from typing import Any
 
 from adk_chatkit import ADKAgentContext, ADKChatKitServer, ADKContext, ADKStore, ChatkitRunConfig, stream_agent_response
 from chatkit.types import (
@@ -29,16 +28,11 @@ def _make_airline_support_agent(settings: Settings) -> AirlineSupportAgent:
 
 
 def _user_message_text(item: UserMessageItem) -> str:
-    parts: list[str] = []
-    for part in item.content:
-        text = getattr(part, "text", None)
-        if text:
-            parts.append(text)
-    return " ".join(parts).strip()
-
-
-def _is_tool_completion_item(item: Any) -> bool:
-    return isinstance(item, ClientToolCallItem)
+    if len(item.content) == 1:
+        # Common case: a single text part, no joining needed
+        text = getattr(item.content[0], "text", None)
+        return text.strip() if text else ""
+    return " ".join(text for part in item.content if (text := getattr(part, "text", None))).strip()
 
 
 class AirlineSupportChatKitServer(ADKChatKitServer):
@@ -61,7 +55,7 @@ class AirlineSupportChatKitServer(ADKChatKitServer):
         if item is None:
             return
 
-        if _is_tool_completion_item(item):
+        if isinstance(item, ClientToolCallItem):
             return
 
         message_text = _user_message_text(item)
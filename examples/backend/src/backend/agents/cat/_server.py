@@ -43,16 +43,11 @@ def _make_cat_agent(settings: Settings) -> CatAgent:
 
 
 def _user_message_text(item: UserMessageItem) -> str:
-    parts: list[str] = []
-    for part in item.content:
-        text = getattr(part, "text", None)
-        if text:
-            parts.append(text)
-    return " ".join(parts).strip()
-
-
-def _is_tool_completion_item(item: Any) -> bool:
-    return isinstance(item, ClientToolCallItem)
+    if len(item.content) == 1:
+        # Common case: a single text part, no joining needed
+        text = getattr(item.content[0], "text", None)
+        return text.strip() if text else ""
+    return " ".join(text for part in item.content if (text := getattr(part, "text", None))).strip()
 
 
 class CatChatKitServer(ADKChatKitServer):
@@ -177,7 +172,7 @@ class CatChatKitServer(ADKChatKitServer):
         if item is None:
             return
 
-        if _is_tool_completion_item(item):
+        if isinstance(item, ClientToolCallItem):
             return
 
         message_text = _user_message_text(item)
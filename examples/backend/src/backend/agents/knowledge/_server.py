@@ -58,16 +58,11 @@ def _make_knowledge_agent(settings: Settings, searcher: Searcher) -> KnowledgeAg
 
 
 def _user_message_text(item: UserMessageItem) -> str:
-    parts: list[str] = []
-    for part in item.content:
-        text = getattr(part, "text", None)
-        if text:
-            parts.append(text)
-    return " ".join(parts).strip()
-
-
-def _is_tool_completion_item(item: Any) -> bool:
-    return isinstance(item, ClientToolCallItem)
+    if len(item.content) == 1:
+        # Common case: a single text part, no joining needed
+        text = getattr(item.content[0], "text", None)
+        return text.strip() if text else ""
+    return " ".join(text for part in item.content if (text := getattr(part, "text", None))).strip()
 
 
 def _resolve_document(annotation: Annotation) -> DocumentMetadata | None:
@@ -194,7 +189,7 @@ class KnowledgeAssistantChatKitServer(ADKChatKitServer):
         if item is None:
             return
 
-        if _is_tool_completion_item(item):
+        if isinstance(item, ClientToolCallItem):
             return
 
         message_text = _user_message_text(item)
@@ -1,6 +1,6 @@
 """News Guide agents for ADK."""
 
 from ._news_agent import NewsAgent
-from ._server import NewsChatKitServer
+from ._server import NewsADKContext, NewsChatKitServer
 
-__all__ = ["NewsAgent", "NewsChatKitServer"]
+__all__ = ["NewsADKContext", "NewsAgent", "NewsChatKitServer"]
@@ -159,8 +159,8 @@ async def show_event_list_widget(
     records = validate_cached_items(tool_context, EVENT_CACHE_KEY, event_ids, EventRecord)
 
     # Gracefully handle case where agent mistakenly calls this tool with no events
-    run_config = tool_context._invocation_context.run_config
-    if not isinstance(run_config, ChatkitRunConfig):
+    run_config = ChatkitRunConfig.from_tool_context(tool_context)
+    if run_config is None:
         return {"result": "Not in chatkit context"}
 
     thread = run_config.context.thread
@@ -14,7 +14,7 @@ from google.adk.tools.tool_context import ToolContext
 from google.genai import types as genai_types
 
 from ._utils import prepare_search_response, validate_cached_items
-from .data.article_store import ArticleMetadata, ArticleRecord, ArticleStore
+from .data.article_store import FEATURED_TAG, ArticleMetadata, ArticleStore, get_article_store
 from .widgets.article_list_widget import build_article_list_widget
 
 # Cache key for storing article search results in session state
@@ -73,15 +73,15 @@ _INSTRUCTIONS = """
     Suggest a next step—such as related articles or follow-up angles—whenever it adds value.
 """
 
-FEATURED_PAGE_ID = "featured"
+# The featured landing page lists the articles carrying the store's featured tag
+FEATURED_PAGE_ID = FEATURED_TAG
 
 
 def _ensure_article_store(callback_context: CallbackContext) -> None:
     """Ensure article store exists in the session state."""
     if "article_store" not in callback_context.state:
         data_dir = Path(__file__).parent / "data"
-        article_store = ArticleStore(data_dir)
-        callback_context.state["article_store"] = article_store
+        callback_context.state["article_store"] = get_article_store(data_dir)
 
 
 async def search_articles_by_tags(
@@ -244,25 +244,26 @@ async def get_current_page(
     print("[TOOL CALL] get_current_page")
 
     # Get article_id from run_config context if available
-    run_config = tool_context._invocation_context.run_config
+    run_config = ChatkitRunConfig.from_tool_context(tool_context)
     article_id = None
-    if isinstance(run_config, ChatkitRunConfig):
+    if run_config is not None:
         article_id = getattr(run_config.context, "article_id", None)
 
     if not article_id:
         article_id = FEATURED_PAGE_ID
 
     article_store: ArticleStore = tool_context.state["article_store"]
-    page_type, articles = _load_current_page_records(article_store, article_id)
-
-    payload = {
-        "page": page_type,
-        "articles": [article.model_dump() for article in articles],
-    }
-    if page_type != FEATURED_PAGE_ID:
-        payload["article_id"] = article_id
+    if article_id == FEATURED_PAGE_ID:
+        # featured payload is prepared by the store whenever it (re)loads
+        articles = article_store.list_featured_articles()
+        if not articles:
+            raise ValueError("Unable to locate any featured articles to load.")
+        return {"page": FEATURED_PAGE_ID, "articles": articles}
 
-    return payload
+    record = article_store.get_record(article_id)
+    if not record:
+        raise ValueError(f"Article '{article_id}' does not exist.")
+    return {"page": "article", "articles": [record.model_dump()], "article_id": article_id}
 
 
 async def show_article_list_widget(
@@ -283,8 +284,8 @@ async def show_article_list_widget(
     if not article_ids:
         raise ValueError("Provide at least one article ID before calling this tool.")
 
-    run_config = tool_context._invocation_context.run_config
-    if not isinstance(run_config, ChatkitRunConfig):
+    run_config = ChatkitRunConfig.from_tool_context(tool_context)
+    if run_config is None:
         return {"result": "Not in chatkit context"}
 
     thread = run_config.context.thread
@@ -314,39 +315,6 @@ async def show_article_list_widget(
         raise
 
 
-def _load_featured_articles(store: ArticleStore) -> list[ArticleRecord]:
-    """Load all featured articles."""
-    metadata_entries = store.list_metadata_for_tags([FEATURED_PAGE_ID])
-    articles: list[ArticleRecord] = []
-    seen: set[str] = set()
-
-    for entry in metadata_entries:
-        article_id = entry.id
-        if not article_id or article_id in seen:
-            continue
-
-        record = store.get_article(article_id)
-        if record:
-            articles.append(ArticleRecord.model_validate(record))
-            seen.add(article_id)
-
-    return articles
-
-
-def _load_current_page_records(store: ArticleStore, article_id: str) -> tuple[str, list[ArticleRecord]]:
-    """Load records for the current page."""
-    if article_id == FEATURED_PAGE_ID:
-        articles = _load_featured_articles(store)
-        if not articles:
-            raise ValueError("Unable to locate any featured articles to load.")
-        return FEATURED_PAGE_ID, articles
-
-    record = store.get_article(article_id)
-    if not record:
-        raise ValueError(f"Article '{article_id}' does not exist.")
-    return "article", [ArticleRecord.model_validate(record)]
-
-
 class NewsAgent(LlmAgent):
     def __init__(
         self,
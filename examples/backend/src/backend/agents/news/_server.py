@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
@@ -15,8 +17,10 @@ from chatkit.types import (
     WidgetItem,
     WidgetRootUpdated,
 )
+from google.adk.agents import BaseAgent
 from google.adk.agents.run_config import StreamingMode
 from google.adk.models.lite_llm import LiteLlm
+from google.adk.runners import Runner
 from google.adk.sessions.base_session_service import BaseSessionService
 from google.genai import types as genai_types
 
@@ -27,10 +31,18 @@ from ._event_finder_agent import EventFinderAgent
 from ._news_agent import NewsAgent
 from ._puzzle_agent import PuzzleAgent
 from ._title_agent import TitleAgent
-from .data.article_store import ArticleStore
-from .data.event_store import EventRecord, EventStore
+from .data.article_store import get_article_store
+from .data.event_store import EventStore
 from .widgets.event_list_widget import build_event_list_widget
 
+_LOGGER = logging.getLogger(__name__)
+
+
+class NewsADKContext(ADKContext):
+    """Extended request context for the news server with article_id support."""
+
+    article_id: str | None = None
+
 
 class NewsAgentContext(ADKAgentContext):
     """Extended context for news agent with article_id support."""
@@ -38,53 +50,55 @@ class NewsAgentContext(ADKAgentContext):
     article_id: Optional[str] = None
 
 
-def _make_news_agent(settings: Settings) -> NewsAgent:
+def _article_id(context: ADKContext) -> str | None:
+    return context.article_id if isinstance(context, NewsADKContext) else None
+
+
+def _make_llm(settings: Settings) -> LiteLlm:
+    return LiteLlm(
+        model=settings.gpt41_mini_agent.llm.model_name,
+        **settings.gpt41_mini_agent.llm.provider_args,
+    )
+
+
+def _make_news_agent(llm: LiteLlm, settings: Settings) -> NewsAgent:
     return NewsAgent(
-        llm=LiteLlm(
-            model=settings.gpt41_mini_agent.llm.model_name,
-            **settings.gpt41_mini_agent.llm.provider_args,
-        ),
+        llm=llm,
         generate_content_config=settings.gpt41_mini_agent.generate_content,
     )
 
 
-def _make_event_finder_agent(settings: Settings) -> EventFinderAgent:
+def _make_event_finder_agent(llm: LiteLlm, settings: Settings) -> EventFinderAgent:
     return EventFinderAgent(
-        llm=LiteLlm(
-            model=settings.gpt41_mini_agent.llm.model_name,
-            **settings.gpt41_mini_agent.llm.provider_args,
-        ),
+        llm=llm,
         generate_content_config=settings.gpt41_mini_agent.generate_content,
     )
 
 
-def _make_puzzle_agent(settings: Settings) -> PuzzleAgent:
+def _make_puzzle_agent(llm: LiteLlm, settings: Settings) -> PuzzleAgent:
     return PuzzleAgent(
-        llm=LiteLlm(
-            model=settings.gpt41_mini_agent.llm.model_name,
-            **settings.gpt41_mini_agent.llm.provider_args,
-        ),
+        llm=llm,
         generate_content_config=settings.gpt41_mini_agent.generate_content,
     )
 
 
-def _make_title_agent(settings: Settings) -> TitleAgent:
+def _make_title_agent(llm: LiteLlm, settings: Settings) -> TitleAgent:
     return TitleAgent(
-        llm=LiteLlm(
-            model=settings.gpt41_mini_agent.llm.model_name,
-            **settings.gpt41_mini_agent.llm.provider_args,
-        ),
+        llm=llm,
         generate_content_config=settings.gpt41_mini_agent.generate_content,
     )
 
 
+def _user_content(text: str) -> genai_types.Content:
+    return genai_types.Content(role="user", parts=[genai_types.Part(text=text)])
+
+
 def _user_message_text(item: UserMessageItem) -> str:
-    parts: list[str] = []
-    for part in item.content:
-        text = getattr(part, "text", None)
-        if text:
-            parts.append(text)
-    return " ".join(parts).strip()
+    if len(item.content) == 1:
+        # Common case: a single text part, no joining needed
+        text = getattr(item.content[0], "text", None)
+        return text.strip() if text else ""
+    return " ".join(text for part in item.content if (text := getattr(part, "text", None))).strip()
 
 
 class NewsChatKitServer(ADKChatKitServer):
@@ -102,31 +116,43 @@ class NewsChatKitServer(ADKChatKitServer):
 
         # Create data stores
         data_dir = Path(__file__).parent / "data"
-        self.article_store = ArticleStore(data_dir)
+        self.article_store = get_article_store(data_dir)
         self.event_store = EventStore(data_dir)
 
-        # Create agents
-        news_agent = _make_news_agent(settings)
-        event_finder_agent = _make_event_finder_agent(settings)
-        puzzle_agent = _make_puzzle_agent(settings)
-        title_agent = _make_title_agent(settings)
-
-        # Create runners for each agent with unique app names
+        # Agents are built on first use; a session may only ever talk to the news agent.
         # Each runner manages its own session storage namespace, but they share thread metadata
         # through the common store. This allows clean delegation without context pollution.
         base_app_name = settings.NEWS_APP_NAME
-        self._news_runner = runner_manager.add_runner(base_app_name, news_agent)
         self._news_runner_app_name = base_app_name
-
-        self._event_runner = runner_manager.add_runner(f"{base_app_name}_events", event_finder_agent)
         self._event_runner_app_name = f"{base_app_name}_events"
-
-        self._puzzle_runner = runner_manager.add_runner(f"{base_app_name}_puzzle", puzzle_agent)
         self._puzzle_runner_app_name = f"{base_app_name}_puzzle"
-
-        self._title_runner = runner_manager.add_runner(f"{base_app_name}_title", title_agent)
         self._title_runner_app_name = f"{base_app_name}_title"
 
+        # All agents talk to the same model, so they share one client.
+        self._llm = _make_llm(settings)
+        self._runner_manager = runner_manager
+        self._agent_factories: dict[str, Callable[[LiteLlm, Settings], BaseAgent]] = {
+            self._news_runner_app_name: _make_news_agent,
+            self._event_runner_app_name: _make_event_finder_agent,
+            self._puzzle_runner_app_name: _make_puzzle_agent,
+            self._title_runner_app_name: _make_title_agent,
+        }
+        self._runners: dict[str, Runner] = {}
+        # Composer tool choices that route the message to a delegate agent instead of the news agent
+        self._delegate_app_names: dict[str | None, str] = {
+            "delegate_to_event_finder": self._event_runner_app_name,
+            "delegate_to_puzzle_keeper": self._puzzle_runner_app_name,
+        }
+
+    def _get_runner(self, app_name: str) -> Runner:
+        """Return the runner for app_name, creating its agent on first use."""
+        runner = self._runners.get(app_name)
+        if runner is None:
+            agent = self._agent_factories[app_name](self._llm, self._settings)
+            runner = self._runner_manager.add_runner(app_name, agent)
+            self._runners[app_name] = runner
+        return runner
+
     async def _run_agent_with_message(
         self,
         thread: ThreadMetadata,
@@ -135,7 +161,7 @@ class NewsChatKitServer(ADKChatKitServer):
     ) -> AsyncIterator[ThreadStreamEvent]:
         """Helper to run the news agent with a message string."""
         # Extract article_id from context if available
-        article_id = getattr(context, "article_id", None)
+        article_id = _article_id(context)
 
         agent_context = NewsAgentContext(
             app_name=self._news_runner_app_name,
@@ -144,15 +170,10 @@ class NewsChatKitServer(ADKChatKitServer):
             article_id=article_id,
         )
 
-        content = genai_types.Content(
-            role="user",
-            parts=[genai_types.Part.from_text(text=message)],
-        )
-
-        event_stream = self._news_runner.run_async(
+        event_stream = self._get_runner(self._news_runner_app_name).run_async(
             user_id=context.user_id,
             session_id=thread.id,
-            new_message=content,
+            new_message=_user_content(message),
             run_config=ChatkitRunConfig(streaming_mode=StreamingMode.SSE, context=agent_context),
         )
 
@@ -213,11 +234,7 @@ class NewsChatKitServer(ADKChatKitServer):
             return
 
         # Rebuild widget with selected event
-        records: list[EventRecord] = []
-        for event_id in event_ids:
-            event_record = self.event_store.get_event(event_id)
-            if event_record:
-                records.append(event_record)
+        records = self.event_store.get_events(event_ids)
 
         updated_widget = build_event_list_widget(records, selected_event_id=selected_event_id)
 
@@ -239,15 +256,11 @@ class NewsChatKitServer(ADKChatKitServer):
         if not message_text:
             return
 
-        # Update thread title if needed (in background)
-        if thread.title is None:
-            await self._maybe_update_thread_title(thread, message_text, context)
-
         # Select which agent to use
         runner, runner_app_name = self._select_runner(item)
 
         # Extract article_id from context if available
-        article_id = getattr(context, "article_id", None)
+        article_id = _article_id(context)
 
         # Create agent context with the runner's app_name to ensure session lookup works correctly
         agent_context = NewsAgentContext(
@@ -261,42 +274,68 @@ class NewsChatKitServer(ADKChatKitServer):
         event_stream = runner.run_async(
             user_id=context.user_id,
             session_id=thread.id,
-            new_message=genai_types.Content(
-                role="user",
-                parts=[genai_types.Part.from_text(text=message_text)],
-            ),
+            new_message=_user_content(message_text),
             run_config=ChatkitRunConfig(streaming_mode=StreamingMode.SSE, context=agent_context),
         )
 
-        async for event in stream_agent_response(agent_context, event_stream):
-            yield event
+        # Generate the thread title alongside the agent run instead of delaying its first token.
+        # Started only once the run is set up, so a failure there cannot leave the task running.
+        title_task: asyncio.Task[str] | None = None
+        if thread.title is None:
+            title_task = asyncio.create_task(self._generate_thread_title(message_text, context.user_id))
 
-    async def _maybe_update_thread_title(self, thread: ThreadMetadata, message_text: str, context: ADKContext) -> None:
-        """Generate and update thread title using the title agent."""
-        # TODO: Implement async title generation
-        # For now, use a simple default title
         try:
-            if len(message_text) > 50:
-                title = message_text[:47] + "..."
-            else:
-                title = message_text
-            thread.title = title.strip()
-            await self._store.save_thread(thread, context)
-        except Exception as exc:
-            print(f"[ERROR] Failed to update thread title: {exc}")
-
-    def _select_runner(self, item: UserMessageItem | None) -> tuple[Any, str]:
+            async for event in stream_agent_response(agent_context, event_stream):
+                yield event
+        except BaseException:
+            # Stream failed or was closed early; the title is not needed anymore
+            if title_task is not None:
+                title_task.cancel()
+            raise
+
+        # The title is only applied once the run is over: ChatKit persists the changed thread at the
+        # end of the stream, and saving it mid-run would append to the session the runner is using.
+        if title_task is not None:
+            thread.title = await title_task
+
+    async def _generate_thread_title(self, message_text: str, user_id: str) -> str:
+        """Generate a thread title using the title agent, falling back to the truncated message."""
+        title: str | None = None
+        try:
+            title = await self._run_title_agent(message_text, user_id)
+        except Exception:
+            _LOGGER.exception("Failed to generate thread title")
+
+        if not title:
+            title = message_text[:47] + "..." if len(message_text) > 50 else message_text
+        return title.strip()
+
+    async def _run_title_agent(self, message_text: str, user_id: str) -> str | None:
+        """Ask the title agent for a title in a throwaway session."""
+        app_name = self._title_runner_app_name
+        runner = self._get_runner(app_name)
+        session = await self._session_service.create_session(app_name=app_name, user_id=user_id)
+        title: str | None = None
+        try:
+            async for event in runner.run_async(
+                user_id=user_id,
+                session_id=session.id,
+                new_message=_user_content(message_text),
+            ):
+                if event.is_final_response() and event.content and event.content.parts:
+                    title = "".join(part.text or "" for part in event.content.parts).strip()
+        finally:
+            await self._session_service.delete_session(app_name=app_name, user_id=user_id, session_id=session.id)
+        return title
+
+    def _select_runner(self, item: UserMessageItem | None) -> tuple[Runner, str]:
         """Select which agent runner to use based on tool choice.
 
         Returns:
             tuple[Runner, str]: The runner and its app_name for session management.
         """
-        tool_choice = self._resolve_tool_choice(item)
-        if tool_choice == "delegate_to_event_finder":
-            return self._event_runner, self._event_runner_app_name
-        if tool_choice == "delegate_to_puzzle_keeper":
-            return self._puzzle_runner, self._puzzle_runner_app_name
-        return self._news_runner, self._news_runner_app_name
+        app_name = self._delegate_app_names.get(self._resolve_tool_choice(item), self._news_runner_app_name)
+        return self._get_runner(app_name), app_name
 
     def _resolve_tool_choice(self, item: UserMessageItem | None) -> str | None:
         """Extract tool choice from user message inference options."""
@@ -19,13 +19,17 @@ These utilities may be promoted to adk-chatkit once patterns are validated.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from google.adk.tools.tool_context import ToolContext
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 T = TypeVar("T", bound=BaseModel)
 
+# Match {word} but not {{word}} (already escaped)
+_TEMPLATE_RE = re.compile(r"(?<!\{)\{([a-zA-Z_][a-zA-Z0-9_]*)\}(?!\})")
+
 
 # =============================================================================
 # INSTRUCTION TEMPLATE UTILITIES
@@ -46,9 +50,7 @@ def escape_instruction_templates(instruction: str) -> str:
     Returns:
         Instruction with patterns escaped as {{variable}}
     """
-    # Match {word} but not {{word}} (already escaped)
-    pattern = r"(?<!\{)\{([a-zA-Z_][a-zA-Z0-9_]*)\}(?!\})"
-    return re.sub(pattern, r"{{\1}}", instruction)
+    return _TEMPLATE_RE.sub(r"{{\1}}", instruction)
 
 
 # =============================================================================
@@ -56,6 +58,12 @@ def escape_instruction_templates(instruction: str) -> str:
 # =============================================================================
 
 
+@lru_cache(maxsize=None)
+def _list_adapter(model_class: type[T]) -> TypeAdapter[list[T]]:
+    """Build (once per model class) an adapter that validates a whole list in a single call."""
+    return TypeAdapter(list[model_class])  # type: ignore[valid-type]
+
+
 class SearchResultCache:
     """
     Cache for search results that handles the LLM field-dropping problem.
@@ -83,13 +91,19 @@ class SearchResultCache:
         id_field: str = "id",
     ) -> list[str]:
         """Store items in cache and return their IDs."""
-        cache: dict[str, Any] = tool_context.state.setdefault(self.cache_key, {})
+        state = tool_context.state
+        cache: dict[str, Any] | None = state.get(self.cache_key)
+        if cache is None:
+            cache = {}
         item_ids: list[str] = []
         for item in items:
             item_id = str(item.get(id_field, ""))
             if item_id:
                 cache[item_id] = item
                 item_ids.append(item_id)
+        # Always assign: ADK only records a state delta (and persists it) on assignment,
+        # so mutating an existing cache in place would be lost with the session.
+        state[self.cache_key] = cache
         return item_ids
 
     def store_and_summarize(
@@ -103,12 +117,14 @@ class SearchResultCache:
     ) -> dict[str, Any]:
         """Store items and return a summarized response for the LLM."""
         if summary_fields is None:
-            summary_fields = [id_field, "title"]
+            fields: tuple[str, ...] = (id_field, "title")
         elif id_field not in summary_fields:
-            summary_fields = [id_field, *summary_fields]
+            fields = (id_field, *summary_fields)
+        else:
+            fields = tuple(summary_fields)
 
         item_ids = self.store(tool_context, items, id_field)
-        summaries = [{f: item.get(f) for f in summary_fields if f in item} for item in items]
+        summaries = [{f: item[f] for f in fields if f in item} for item in items]
 
         return {"count": len(items), ids_key: item_ids, items_key: summaries}
 
@@ -120,8 +136,8 @@ class SearchResultCache:
     ) -> list[T]:
         """Retrieve items from cache and validate to Pydantic models."""
         cache: dict[str, Any] = tool_context.state.get(self.cache_key, {})
-        items = [cache[item_id] for item_id in item_ids if item_id in cache]
-        return [model_class.model_validate(item) for item in items]
+        items = [item for item_id in item_ids if (item := cache.get(item_id)) is not None]
+        return _list_adapter(model_class).validate_python(items)
 
     def get(self, tool_context: ToolContext, item_id: str) -> dict[str, Any] | None:
         """Get a single cached item by ID."""
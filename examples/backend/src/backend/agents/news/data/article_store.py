@@ -4,12 +4,12 @@ Data models and store for News Guide demo articles.
 
 from __future__ import annotations
 
-import json
 import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
 
+import orjson
 from pydantic import BaseModel, Field, ValidationError
 
 
@@ -21,6 +21,9 @@ def slugify(value: str) -> str:
     return normalized
 
 
+FEATURED_TAG = "featured"
+
+
 class ArticleMetadata(BaseModel):
     """Describes a published article without the markdown body."""
 
@@ -52,6 +55,11 @@ class ArticleStore:
         self.data_dir = Path(data_dir)
         self._articles: Dict[str, ArticleRecord] = {}
         self._order: List[str] = []
+        self._author_index: Dict[str, List[str]] = {}
+        self._author_slugs: Dict[str, str] = {}
+        self._metadata: Dict[str, Dict[str, Any]] = {}
+        self._featured_articles: List[Dict[str, Any]] = []
+        self._source_mtime_ns = 0
         self.reload()
 
     @property
@@ -62,27 +70,53 @@ class ArticleStore:
     def metadata_path(self) -> Path:
         return self.data_dir / "articles.json"
 
+    def source_mtime_ns(self) -> int:
+        """Latest modification time across the metadata file and markdown bodies."""
+        paths = [self.metadata_path, *self.articles_path.glob("*.md")]
+        return max((path.stat().st_mtime_ns for path in paths if path.exists()), default=0)
+
+    def is_stale(self) -> bool:
+        """Whether the files on disk changed since the last reload."""
+        return self.source_mtime_ns() != self._source_mtime_ns
+
     def reload(self) -> None:
         """Hydrate articles from metadata + markdown files."""
+        source_mtime_ns = self.source_mtime_ns()
         metadata_entries = self._load_metadata()
         articles: Dict[str, ArticleRecord] = {}
         order: List[str] = []
+        author_index: Dict[str, List[str]] = {}
+        author_slugs: Dict[str, str] = {}
+        metadata: Dict[str, Dict[str, Any]] = {}
+        featured_articles: List[Dict[str, Any]] = []
 
         for entry in metadata_entries:
             markdown = self._load_markdown(entry)
             record = ArticleRecord(**entry.model_dump(), content=markdown)
             articles[record.id] = record
             order.append(record.id)
+            metadata[record.id] = record.model_dump(exclude={"content"})
+            metadata[record.id]["date"] = record.date.isoformat()
+            if record.author:
+                author_name = record.author.lower()
+                author_index.setdefault(author_name, []).append(record.id)
+                author_slugs.setdefault(author_name, slugify(record.author))
+            if FEATURED_TAG in record.tags:
+                featured_articles.append(record.model_dump())
 
         self._articles = articles
         self._order = order
+        self._author_index = author_index
+        self._author_slugs = author_slugs
+        self._metadata = metadata
+        self._featured_articles = featured_articles
+        self._source_mtime_ns = source_mtime_ns
 
     def _load_metadata(self) -> Iterable[ArticleMetadata]:
         if not self.metadata_path.exists():
             raise FileNotFoundError(f"Missing article metadata file: {self.metadata_path}")
 
-        with self.metadata_path.open("r", encoding="utf-8") as file:
-            raw = json.load(file)
+        raw = orjson.loads(self.metadata_path.read_bytes())
 
         if not isinstance(raw, list):
             raise ValueError("articles.json must contain a list of article entries.")
@@ -127,6 +161,14 @@ class ArticleStore:
 
         return payload
 
+    def list_featured_articles(self) -> List[Dict[str, Any]]:
+        """Return the full records (content included) of featured articles in list order."""
+        return [dict(article) for article in self._featured_articles]
+
+    def get_record(self, article_id: str) -> ArticleRecord | None:
+        """Return the validated record (metadata plus markdown) for an article."""
+        return self._articles.get(article_id)
+
     def get_article(self, article_id: str) -> Dict[str, Any] | None:
         record = self._articles.get(article_id)
         if not record:
@@ -136,12 +178,10 @@ class ArticleStore:
         return payload
 
     def get_metadata(self, article_id: str) -> Dict[str, Any] | None:
-        record = self._articles.get(article_id)
-        if not record:
+        metadata = self._metadata.get(article_id)
+        if metadata is None:
             return None
-        data = record.model_dump(exclude={"content"})
-        data["date"] = record.date.isoformat()
-        return data
+        return dict(metadata)
 
     def list_authors(self) -> list[dict[str, Any]]:
         """
@@ -176,8 +216,7 @@ class ArticleStore:
         tagged_metadata: Dict[str, List[Dict[str, Any]]] = {}
         for article_id in self._order:
             record = self._articles[article_id]
-            metadata = record.model_dump(exclude={"content"})
-            metadata["date"] = record.date.isoformat()
+            metadata = dict(self._metadata[article_id])
             for tag in record.tags:
                 tagged_metadata.setdefault(tag.lower(), []).append(metadata)
         return tagged_metadata
@@ -204,9 +243,7 @@ class ArticleStore:
             record = self._articles[article_id]
             metadata_fields = self._metadata_search_fields(record)
             if any(term in field for term in search_terms for field in metadata_fields):
-                metadata = record.model_dump(exclude={"content"})
-                metadata["date"] = record.date.isoformat()
-                matches.append(metadata)
+                matches.append(dict(self._metadata[article_id]))
 
         return matches
 
@@ -223,9 +260,7 @@ class ArticleStore:
             record = self._articles[article_id]
             if trimmed not in record.content:
                 continue
-            metadata = record.model_dump(exclude={"content"})
-            metadata["date"] = record.date.isoformat()
-            matches.append(metadata)
+            matches.append(dict(self._metadata[article_id]))
         return matches
 
     def _metadata_search_fields(self, record: ArticleRecord) -> List[str]:
@@ -268,14 +303,36 @@ class ArticleStore:
             return []
 
         normalized_slug = slugify(normalized)
-        matches: List[Dict[str, Any]] = []
-        for article_id in self._order:
-            record = self._articles[article_id]
-            author_name = record.author.lower()
-            author_slug = slugify(record.author)
-            if normalized in author_name or normalized_slug == author_slug or normalized in author_slug:
-                metadata = record.model_dump(exclude={"content"})
-                metadata["date"] = record.date.isoformat()
-                matches.append(metadata)
+        matched_authors = [
+            author_name
+            for author_name, author_slug in self._author_slugs.items()
+            if normalized in author_name or normalized_slug == author_slug or normalized in author_slug
+        ]
+        if not matched_authors:
+            return []
 
-        return matches
+        if len(matched_authors) == 1:
+            article_ids = self._author_index[matched_authors[0]]
+        else:
+            # several authors matched; restore the overall article order
+            matched_ids = {article_id for name in matched_authors for article_id in self._author_index[name]}
+            article_ids = [article_id for article_id in self._order if article_id in matched_ids]
+
+        return [dict(self._metadata[article_id]) for article_id in article_ids]
+
+
+_STORES: Dict[Path, ArticleStore] = {}
+
+
+def get_article_store(data_dir: str | Path) -> ArticleStore:
+    """
+    Return the process-wide store for data_dir, building it on first use.
+    The store is reloaded when the article files change on disk.
+    """
+    key = Path(data_dir).resolve()
+    store = _STORES.get(key)
+    if store is None:
+        store = _STORES[key] = ArticleStore(key)
+    elif store.is_stale():
+        store.reload()
+    return store
@@ -4,12 +4,12 @@ Data models and search helpers for News Guide events.
 
 from __future__ import annotations
 
-import json
 import re
 from datetime import date, datetime, time
 from pathlib import Path
 from typing import Dict, Iterable, List, Sequence
 
+import orjson
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 
@@ -50,8 +50,7 @@ class EventStore:
         if not self.events_path.exists():
             raise FileNotFoundError(f"Missing events metadata file: {self.events_path}")
 
-        with self.events_path.open("r", encoding="utf-8") as file:
-            raw = json.load(file)
+        raw = orjson.loads(self.events_path.read_bytes())
 
         if not isinstance(raw, list):
             raise ValueError("events.json must contain a list of event entries.")
@@ -76,6 +75,11 @@ class EventStore:
     def get_event(self, event_id: str) -> EventRecord | None:
         return self._events.get(event_id)
 
+    def get_events(self, event_ids: Iterable[str]) -> List[EventRecord]:
+        """Return the events for the given ids in input order, skipping unknown ids."""
+        events = self._events
+        return [events[event_id] for event_id in event_ids if event_id in events]
+
     def search_by_date(self, value: str | date | datetime) -> List[EventRecord]:
         target = self._parse_date(value)
         if not target:
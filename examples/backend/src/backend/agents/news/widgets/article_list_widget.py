@@ -5,7 +5,8 @@ same layout cues as the featured article card in the Newsroom panel.
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Any
 
 from chatkit.widgets import ListView, WidgetRoot
@@ -14,6 +15,11 @@ from ..data.article_store import ArticleMetadata
 
 
 def _format_date(value: datetime) -> str:
+    return _format_day(value.date())
+
+
+@lru_cache(maxsize=512)
+def _format_day(value: date) -> str:
     month = value.strftime("%b")
     return f"{month} {value.day}, {value.year}"
 
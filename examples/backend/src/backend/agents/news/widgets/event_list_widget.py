@@ -4,8 +4,9 @@ Widget helpers for presenting a list of events with timeline styling.
 
 from __future__ import annotations
 
-from datetime import date, datetime
-from itertools import groupby
+from datetime import date, time
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, Iterable, Mapping
 
 from chatkit.widgets import ListView, WidgetRoot
@@ -24,8 +25,32 @@ CATEGORY_COLORS: dict[str, str] = {
 }
 DEFAULT_CATEGORY_COLOR = "gray-400"
 
+# Static pieces of each event row. Widget validation builds fresh models from these,
+# so the same dicts can be referenced by every row.
+_DOT_SEPARATOR: dict[str, Any] = {"type": "Caption", "value": "·"}
+_CATEGORY_DOTS: dict[str, dict[str, Any]] = {
+    color: {
+        "type": "Box",
+        "width": 4,
+        "flex": "none",
+        "align": "center",
+        "children": [
+            {
+                "type": "Box",
+                "width": 3,
+                "height": 3,
+                "radius": "full",
+                "background": color,
+            }
+        ],
+    }
+    for color in (*CATEGORY_COLORS.values(), DEFAULT_CATEGORY_COLOR)
+}
+
 EventLike = EventRecord | Mapping[str, Any]
 
+_date_key = attrgetter("date")
+
 
 def build_event_list_widget(
     events: Iterable[EventLike],
@@ -33,127 +58,112 @@ def build_event_list_widget(
 ) -> WidgetRoot:
     """Render an event list widget grouped by date programmatically."""
     records = [_coerce_event(event) for event in events]
-    records.sort(key=lambda rec: rec.date)
-    event_ids: list[str] = [record.id for record in records]
+    records.sort(key=_date_key)
+    # Filled in the same pass that builds the items; every click payload shares this list,
+    # so it is complete by the time the widget is validated.
+    event_ids: list[str] = []
 
     items: list[dict[str, Any]] = []
-
-    # Group events by date
-    for event_date, group in groupby(records, key=lambda rec: rec.date):
-        group_records = list(group)
-
-        # Add date header
-        items.append(
-            {
-                "type": "ListViewItem",
-                "key": f"date-{event_date.isoformat()}",
-                "children": [
-                    {
-                        "type": "Box",
-                        "padding": {"top": 3, "bottom": 1},
-                        "children": [
-                            {
-                                "type": "Caption",
-                                "value": _format_date(event_date),
-                                "weight": "semibold",
-                            }
-                        ],
-                    }
-                ],
-            }
-        )
-
-        # Add events for this date
-        for record in group_records:
-            is_selected = selected_event_id and selected_event_id == record.id
-            category = (record.category or "").strip().lower()
-            color = CATEGORY_COLORS.get(category, DEFAULT_CATEGORY_COLOR)
-
-            item_data: dict[str, Any] = {
-                "type": "ListViewItem",
-                "key": record.id,
-                "children": [
-                    {
-                        "type": "Row",
-                        "gap": 3,
-                        "align": "start",
-                        "children": [
-                            {
-                                "type": "Box",
-                                "width": 4,
-                                "flex": "none",
-                                "align": "center",
-                                "children": [
-                                    {
-                                        "type": "Box",
-                                        "width": 3,
-                                        "height": 3,
-                                        "radius": "full",
-                                        "background": color,
-                                    }
-                                ],
-                            },
-                            {
-                                "type": "Col",
-                                "gap": 1,
-                                "flex": "auto",
-                                "children": [
-                                    {
-                                        "type": "Text",
-                                        "value": record.title,
-                                        "weight": "semibold" if is_selected else "medium",
-                                        "color": "emphasis" if is_selected else None,
-                                    },
-                                    {
-                                        "type": "Row",
-                                        "gap": 2,
-                                        "children": [
-                                            {
-                                                "type": "Caption",
-                                                "value": _format_time(record),
-                                            },
-                                            {
-                                                "type": "Caption",
-                                                "value": "·",
-                                            },
-                                            {
-                                                "type": "Caption",
-                                                "value": record.location,
-                                            },
-                                        ],
-                                    },
-                                    *(
-                                        [
-                                            {
-                                                "type": "Text",
-                                                "value": record.details,
-                                                "size": "sm",
-                                                "color": "secondary",
-                                                "maxLines": 2,
-                                            }
-                                        ]
-                                        if is_selected
-                                        else []
-                                    ),
-                                ],
-                            },
-                        ],
-                    }
-                ],
-            }
-
-            # Add click action only if not selected
-            if not selected_event_id:
-                item_data["onClickAction"] = {
-                    "type": "view_event_details",
-                    "handler": "client",
-                    "payload": {
-                        "id": record.id,
-                        "eventIds": event_ids,
-                    },
+    prev_date: date | None = None
+
+    for record in records:
+        event_ids.append(record.id)
+
+        # Add a date header whenever a new day starts
+        if record.date != prev_date:
+            prev_date = record.date
+            items.append(
+                {
+                    "type": "ListViewItem",
+                    "key": f"date-{record.date.isoformat()}",
+                    "children": [
+                        {
+                            "type": "Box",
+                            "padding": {"top": 3, "bottom": 1},
+                            "children": [
+                                {
+                                    "type": "Caption",
+                                    "value": _format_date(record.date),
+                                    "weight": "semibold",
+                                }
+                            ],
+                        }
+                    ],
+                }
+            )
+
+        is_selected = selected_event_id and selected_event_id == record.id
+        category = (record.category or "").strip().lower()
+        color = CATEGORY_COLORS.get(category, DEFAULT_CATEGORY_COLOR)
+
+        item_data: dict[str, Any] = {
+            "type": "ListViewItem",
+            "key": record.id,
+            "children": [
+                {
+                    "type": "Row",
+                    "gap": 3,
+                    "align": "start",
+                    "children": [
+                        _CATEGORY_DOTS[color],
+                        {
+                            "type": "Col",
+                            "gap": 1,
+                            "flex": "auto",
+                            "children": [
+                                {
+                                    "type": "Text",
+                                    "value": record.title,
+                                    "weight": "semibold" if is_selected else "medium",
+                                    "color": "emphasis" if is_selected else None,
+                                },
+                                {
+                                    "type": "Row",
+                                    "gap": 2,
+                                    "children": [
+                                        {
+                                            "type": "Caption",
+                                            "value": _format_time(record),
+                                        },
+                                        _DOT_SEPARATOR,
+                                        {
+                                            "type": "Caption",
+                                            "value": record.location,
+                                        },
+                                    ],
+                                },
+                                *(
+                                    [
+                                        {
+                                            "type": "Text",
+                                            "value": record.details,
+                                            "size": "sm",
+                                            "color": "secondary",
+                                            "maxLines": 2,
+                                        }
+                                    ]
+                                    if is_selected
+                                    else []
+                                ),
+                            ],
+                        },
+                    ],
                 }
+            ],
+        }
+
+        # Add click action only if not selected
+        if not selected_event_id:
+            item_data["onClickAction"] = {
+                "type": "view_event_details",
+                "handler": "client",
+                "payload": {
+                    "id": record.id,
+                    "eventIds": event_ids,
+                },
+            }
 
-            items.append(item_data)
+        items.append(item_data)
 
     widget_data = {"type": "ListView", "children": items}
     return ListView.model_validate(widget_data)
@@ -165,6 +175,7 @@ def _coerce_event(event: EventLike) -> EventRecord:
     return EventRecord.model_validate(event)
 
 
+@lru_cache(maxsize=512)
 def _format_date(event_date: date) -> str:
     month = event_date.strftime("%b")
     weekday = event_date.strftime("%A")
@@ -172,6 +183,10 @@ def _format_date(event_date: date) -> str:
 
 
 def _format_time(record: EventRecord) -> str:
-    value = datetime.combine(record.date, record.time)
-    formatted = value.strftime("%I:%M %p")
+    return _format_clock_time(record.time)
+
+
+@lru_cache(maxsize=512)
+def _format_clock_time(event_time: time) -> str:
+    formatted = event_time.strftime("%I:%M %p")
     return formatted.lstrip("0")
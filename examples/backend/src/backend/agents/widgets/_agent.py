@@ -4,7 +4,7 @@ from google.adk.agents.llm_agent import LlmAgent
 from google.adk.models.lite_llm import LiteLlm
 from google.genai import types as genai_types
 
-from ._tools import render_tasks_widget
+from ._tools import make_render_tasks_widget
 
 _INSTRUCTIONS: Final[str] = """
 You are a widgets agent that helps render widgets in chat. You have access to tools that can render widgets.
@@ -19,6 +19,7 @@ class WidgetsAgent(LlmAgent):
         self,
         llm: LiteLlm,
         generate_content_config: genai_types.GenerateContentConfig | None = None,
+        render_delay_seconds: float = 0.0,
     ) -> None:
         self._llm = llm
 
@@ -28,7 +29,7 @@ class WidgetsAgent(LlmAgent):
             model=self._llm,
             instruction=_INSTRUCTIONS,
             tools=[
-                render_tasks_widget,
+                make_render_tasks_widget(render_delay_seconds),
             ],
             generate_content_config=generate_content_config,
         )
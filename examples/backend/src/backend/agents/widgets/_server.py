@@ -30,20 +30,21 @@ def _make_widgets_agent(settings: Settings) -> WidgetsAgent:
             **settings.gpt41_mini_agent.llm.provider_args,
         ),
         generate_content_config=settings.gpt41_mini_agent.generate_content,
+        render_delay_seconds=settings.WIDGETS_RENDER_DELAY_SECONDS,
     )
 
 
 def _user_message_text(item: UserMessageItem) -> str:
-    parts: list[str] = []
-    for part in item.content:
-        text = getattr(part, "text", None)
-        if text:
-            parts.append(text)
-    return " ".join(parts).strip()
+    if len(item.content) == 1:
+        # Common case: a single text part, no joining needed
+        text = getattr(item.content[0], "text", None)
+        return text.strip() if text else ""
+    return " ".join(text for part in item.content if (text := getattr(part, "text", None))).strip()
 
 
-def _is_tool_completion_item(item: Any) -> bool:
-    return isinstance(item, ClientToolCallItem)
+async def _no_events() -> AsyncIterator[ThreadStreamEvent]:
+    return
+    yield
 
 
 class WidgetsChatKitServer(ADKChatKitServer):
@@ -57,23 +58,30 @@ class WidgetsChatKitServer(ADKChatKitServer):
         super().__init__(store)
         agent = _make_widgets_agent(settings)
         self._session_service = session_service
-        self._runner = runner_manager.add_runner(settings.WIDGETS_APP_NAME, agent)
+        self._app_name = settings.WIDGETS_APP_NAME
+        self._runner = runner_manager.add_runner(self._app_name, agent)
 
-    async def _adk_respond(
+    @property
+    def app_name(self) -> str:
+        """Name of the ADK app the widgets agent runs under."""
+        return self._app_name
+
+    def _adk_respond(
         self,
         thread: ThreadMetadata,
         item: UserMessageItem | None,
         context: ADKContext,
     ) -> AsyncIterator[ThreadStreamEvent]:
+        # Hand the agent's event stream straight back rather than re-yielding every event
         if item is None:
-            return
+            return _no_events()
 
-        if _is_tool_completion_item(item):
-            return
+        if isinstance(item, ClientToolCallItem):
+            return _no_events()
 
         message_text = _user_message_text(item)
         if not message_text:
-            return
+            return _no_events()
 
         content = genai_types.Content(
             role="user",
@@ -93,8 +101,7 @@ class WidgetsChatKitServer(ADKChatKitServer):
             run_config=ChatkitRunConfig(streaming_mode=StreamingMode.SSE, context=enhanced_context),
         )
 
-        async for event in stream_agent_response(enhanced_context, event_stream):
-            yield event
+        return stream_agent_response(enhanced_context, event_stream)
 
     async def action(
         self,
@@ -103,33 +110,26 @@ class WidgetsChatKitServer(ADKChatKitServer):
         sender: WidgetItem | None,
         context: ADKContext,
     ) -> AsyncIterator[ThreadStreamEvent]:
-        if action.type == "tasks.view":
-            assert sender is not None
-            widget = make_tasks_list_widget()
+        # Every widget action answers by replacing the widget it came from
+        if sender is None:
+            return
 
-            yield ThreadItemReplacedEvent(
-                item=WidgetItem(
-                    id=sender.id,
-                    thread_id=thread.id,
-                    widget=widget,
-                    created_at=sender.created_at,
-                )
-            )
+        if action.type == "item.select":
+            yield ThreadItemReplacedEvent(item=sender)
+            return
 
-        if action.type == "nav.back":
-            assert sender is not None
+        if action.type == "tasks.view":
+            widget = make_tasks_list_widget()
+        elif action.type == "nav.back":
             widget = make_widget()
-            yield ThreadItemReplacedEvent(
-                item=WidgetItem(
-                    id=sender.id,
-                    thread_id=thread.id,
-                    widget=widget,
-                    created_at=sender.created_at,
-                )
-            )
+        else:
+            return
 
-        if action.type == "item.select":
-            assert sender is not None
-            yield ThreadItemReplacedEvent(
-                item=sender,
+        yield ThreadItemReplacedEvent(
+            item=WidgetItem(
+                id=sender.id,
+                thread_id=thread.id,
+                widget=widget,
+                created_at=sender.created_at,
             )
+        )
@@ -1,14 +1,20 @@
+from functools import cache
 from pathlib import Path
+from typing import Final
 
 from adk_chatkit import ADKContext
 from chatkit.widgets import Card, ListView, WidgetRoot
 
+_TASKS_DIR: Final[Path] = Path(__file__).parent / "tasks"
+_WIDGET_01_PATH: Final[Path] = _TASKS_DIR / "_01.json"
+_WIDGET_02_PATH: Final[Path] = _TASKS_DIR / "_02.json"
 
+
+@cache
 def make_widget() -> WidgetRoot:
-    serialized_widget_path = Path(__file__).parent / "tasks" / "_01.json"
-    return ListView.model_validate_json(serialized_widget_path.read_text())
+    return ListView.model_validate_json(_WIDGET_01_PATH.read_bytes())
 
 
+@cache
 def make_tasks_list_widget() -> WidgetRoot:
-    serialized_widget_path = Path(__file__).parent / "tasks" / "_02.json"
-    return Card.model_validate_json(serialized_widget_path.read_text())
+    return Card.model_validate_json(_WIDGET_02_PATH.read_bytes())
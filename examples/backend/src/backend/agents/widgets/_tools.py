@@ -1,23 +1,27 @@
 import asyncio
-from typing import cast
+from collections.abc import Awaitable, Callable
 
-from adk_chatkit import ChatkitRunConfig, stream_event, stream_widget
+from adk_chatkit import stream_event, stream_widget
 from chatkit.types import ProgressUpdateEvent
 from google.adk.tools import ToolContext
 
 from ._tasks_widget import make_widget
 
 
-async def render_tasks_widget(tool_context: ToolContext) -> dict[str, str]:
-    """Renders a tasks widget."""
+def make_render_tasks_widget(delay_seconds: float = 0.0) -> Callable[[ToolContext], Awaitable[dict[str, str]]]:
+    async def render_tasks_widget(tool_context: ToolContext) -> dict[str, str]:
+        """Renders a tasks widget."""
 
-    result = dict(success="true")
+        result = dict(success="true")
 
-    await stream_event(ProgressUpdateEvent(text="Fetching tasks widget..."), tool_context)
-    await asyncio.sleep(2)
+        await stream_event(ProgressUpdateEvent(text="Fetching tasks widget..."), tool_context)
+        if delay_seconds:
+            await asyncio.sleep(delay_seconds)
 
-    widget = make_widget()
+        widget = make_widget()
 
-    await stream_widget(widget, tool_context)
+        await stream_widget(widget, tool_context)
 
-    return result
+        return result
+
+    return render_tasks_widget
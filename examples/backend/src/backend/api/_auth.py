@@ -0,0 +1,23 @@
+from functools import lru_cache
+
+from adk_chatkit import ADKContext
+from fastapi import Request
+
+from backend._config import DEFAULT_USER_ID
+
+
+def current_user_id(request: Request) -> str:
+    """Resolve the user making the request.
+
+    Authentication is not wired up in this example, so every request is served as the default user.
+    """
+    return DEFAULT_USER_ID
+
+
+@lru_cache(maxsize=256)
+def request_context(user_id: str, app_name: str) -> ADKContext:
+    """Return the ChatKit request context for a user of an app.
+
+    The context is never mutated, so a single instance is shared by every request for the same pair.
+    """
+    return ADKContext(user_id=user_id, app_name=app_name)
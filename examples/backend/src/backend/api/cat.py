@@ -1,39 +1,44 @@
+import logging
 from typing import Any
 
-from adk_chatkit import ADKContext
 from chatkit.server import StreamingResult
 from dishka.integrations.fastapi import (
     DishkaRoute,
     FromDishka,
 )
-from fastapi import APIRouter, Query, Request
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import Response, StreamingResponse
 from google.adk.sessions.base_session_service import BaseSessionService
 from starlette.responses import JSONResponse
 
 from backend._config import Settings
 from backend.agents.cat import CatAgentContext, CatChatKitServer
+from backend.api._auth import current_user_id, request_context
+
+_LOGGER = logging.getLogger(__name__)
 
 router = APIRouter(route_class=DishkaRoute)
 
+# Snapshot returned before a thread exists; it is only serialized, never mutated
+_INITIAL_CAT_PAYLOAD = CatAgentContext.create_initial_context().to_payload()
+
 
 @router.post("/chatkit")
 async def chatkit_endpoint(
     request: Request,
     settings: FromDishka[Settings],
     request_server: FromDishka[CatChatKitServer],
+    user_id: str = Depends(current_user_id),
 ) -> Response:
     payload = await request.body()
-    print("Received payload:", payload)
-
-    user_id = "ksachdeva-1"
+    _LOGGER.debug("Received chatkit payload (%d bytes)", len(payload))
 
     result = await request_server.process(
         payload,
-        ADKContext(user_id=user_id, app_name=settings.CAT_APP_NAME),
+        request_context(user_id, settings.CAT_APP_NAME),
     )
 
-    print(result)
+    _LOGGER.debug("ChatKit result: %s", type(result).__name__)
 
     if isinstance(result, StreamingResult):
         return StreamingResponse(result, media_type="text/event-stream")
@@ -52,12 +57,10 @@ async def cat_snapshot(
     session_service: FromDishka[BaseSessionService],
     settings: FromDishka[Settings],
     thread_id: str | None = Query(None, description="ChatKit thread identifier"),
+    user_id: str = Depends(current_user_id),
 ) -> dict[str, Any]:
-    user_id = "ksachdeva-1"
-
     if not thread_id:
-        initial_context = CatAgentContext.create_initial_context()
-        return {"cat": initial_context.to_payload()}
+        return {"cat": _INITIAL_CAT_PAYLOAD}
 
     session = await session_service.get_session(
         app_name=settings.CAT_APP_NAME,
@@ -1,15 +1,19 @@
-from adk_chatkit import ADKContext
+import logging
+
 from chatkit.server import StreamingResult
 from dishka.integrations.fastapi import (
     DishkaRoute,
     FromDishka,
 )
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import Response, StreamingResponse
 from starlette.responses import JSONResponse
 
 from backend._config import Settings
 from backend.agents.facts import FactsChatKitServer
+from backend.api._auth import current_user_id, request_context
+
+_LOGGER = logging.getLogger(__name__)
 
 router = APIRouter(route_class=DishkaRoute)
 
@@ -19,18 +23,17 @@ async def chatkit_endpoint(
     request: Request,
     settings: FromDishka[Settings],
     request_server: FromDishka[FactsChatKitServer],
+    user_id: str = Depends(current_user_id),
 ) -> Response:
     payload = await request.body()
-    print("Received payload:", payload)
-
-    user_id = "ksachdeva-1"
+    _LOGGER.debug("Received chatkit payload (%d bytes)", len(payload))
 
     result = await request_server.process(
         payload,
-        ADKContext(user_id=user_id, app_name=settings.FACTS_APP_NAME),
+        request_context(user_id, settings.FACTS_APP_NAME),
     )
 
-    print(result)
+    _LOGGER.debug("ChatKit result: %s", type(result).__name__)
 
     if isinstance(result, StreamingResult):
         return StreamingResponse(result, media_type="text/event-stream")
@@ -1,39 +1,45 @@
+import logging
 import mimetypes
 from typing import Any
 
-from adk_chatkit import ADKContext
+import orjson
 from chatkit.server import StreamingResult
 from dishka.integrations.fastapi import (
     DishkaRoute,
     FromDishka,
 )
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import FileResponse, Response, StreamingResponse
 from starlette.responses import JSONResponse
 
 from backend._config import Settings
 from backend.agents.knowledge import DOCUMENTS, DOCUMENTS_BY_ID, KnowledgeAssistantChatKitServer, as_dicts
+from backend.api._auth import current_user_id, request_context
+
+_LOGGER = logging.getLogger(__name__)
 
 router = APIRouter(route_class=DishkaRoute)
 
+# The document catalog is static, so the /documents body is serialized once
+_DOCUMENTS_JSON = orjson.dumps({"documents": as_dicts(DOCUMENTS)})
+
 
 @router.post("/chatkit")
 async def chatkit_endpoint(
     request: Request,
     settings: FromDishka[Settings],
     request_server: FromDishka[KnowledgeAssistantChatKitServer],
+    user_id: str = Depends(current_user_id),
 ) -> Response:
     payload = await request.body()
-    print("Received payload:", payload)
-
-    user_id = "ksachdeva-1"
+    _LOGGER.debug("Received chatkit payload (%d bytes)", len(payload))
 
     result = await request_server.process(
         payload,
-        ADKContext(user_id=user_id, app_name=settings.KNOWLEDGE_APP_NAME),
+        request_context(user_id, settings.KNOWLEDGE_APP_NAME),
     )
 
-    print(result)
+    _LOGGER.debug("ChatKit result: %s", type(result).__name__)
 
     if isinstance(result, StreamingResult):
         return StreamingResponse(result, media_type="text/event-stream")
@@ -48,8 +54,8 @@ async def health_check() -> dict[str, str]:
 
 
 @router.get("/documents")
-async def list_documents() -> dict[str, Any]:
-    return {"documents": as_dicts(DOCUMENTS)}
+async def list_documents() -> Response:
+    return Response(content=_DOCUMENTS_JSON, media_type="application/json")
 
 
 @router.get("/documents/{document_id}/file")
@@ -79,9 +85,9 @@ async def thread_citations(
     thread_id: str,
     settings: FromDishka[Settings],
     request_server: FromDishka[KnowledgeAssistantChatKitServer],
+    user_id: str = Depends(current_user_id),
 ) -> dict[str, Any]:
-    user_id = "ksachdeva-1"
-    context = ADKContext(user_id=user_id, app_name=settings.KNOWLEDGE_APP_NAME)
+    context = request_context(user_id, settings.KNOWLEDGE_APP_NAME)
 
     try:
         citations = await request_server.latest_citations(thread_id, context=context)
@@ -90,4 +96,4 @@ async def thread_citations(
 
     document_ids = sorted({citation["document_id"] for citation in citations})
 
-    return {"documentIds": [document_ids], "citations": citations}
+    return {"documentIds": document_ids, "citations": citations}
@@ -1,108 +1,74 @@
 """News API endpoints."""
 
-import json
 from pathlib import Path
 from typing import Any
 
-import aiofiles
-from adk_chatkit import ADKContext
+import orjson
 from chatkit.server import StreamingResult
 from dishka.integrations.fastapi import (
     DishkaRoute,
     FromDishka,
 )
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import Response, StreamingResponse
 from starlette.responses import JSONResponse
 
 from backend._config import Settings
-from backend.agents.news import NewsChatKitServer
+from backend.agents.news import NewsADKContext, NewsChatKitServer
+from backend.api._auth import current_user_id
 
 router = APIRouter(route_class=DishkaRoute)
 
 
-class NewsADKContext(ADKContext):
-    """Extended context for news API with article_id support."""
-
-    article_id: str | None = None
-
-
 # Load articles and events data from the agents/news/data directory
 DATA_DIR = Path(__file__).parent.parent / "agents" / "news" / "data"
 ARTICLES_FILE = DATA_DIR / "articles.json"
 EVENTS_FILE = DATA_DIR / "events.json"
 
-# Cache for articles data
-_articles_cache: list[dict[str, Any]] | None = None
-_articles_by_id_cache: dict[str, dict[str, Any]] | None = None
-
-
-async def _load_articles() -> list[dict[str, Any]]:
-    """Load and cache articles from JSON file."""
-    global _articles_cache, _articles_by_id_cache
-
-    if _articles_cache is None:
-        async with aiofiles.open(ARTICLES_FILE, "r", encoding="utf-8") as f:
-            content = await f.read()
-            articles = json.loads(content)
-            # articles.json is a list directly, not {"articles": [...]}
-            _articles_cache = articles if isinstance(articles, list) else []
-            _articles_by_id_cache = {article["id"]: article for article in _articles_cache}
 
-    return _articles_cache if _articles_cache is not None else []
+def _load_entries(path: Path) -> list[dict[str, Any]]:
+    """Load a JSON file holding a list of entries."""
+    entries = orjson.loads(path.read_bytes())
+    # the files hold the list directly, not {"articles": [...]}
+    return entries if isinstance(entries, list) else []
 
 
-async def _get_article_by_id(article_id: str) -> dict[str, Any] | None:
-    """Get a single article by ID from cache."""
-    await _load_articles()  # Ensure cache is populated
-    return _articles_by_id_cache.get(article_id) if _articles_by_id_cache else None
-
-
-async def _load_article_content(article_id: str) -> str:
-    """Load article content from markdown file."""
-    content_file = DATA_DIR / "articles" / f"{article_id}.md"
-    if not content_file.exists():
-        return ""
-
-    async with aiofiles.open(content_file, "r", encoding="utf-8") as f:
-        content = str(await f.read())
-        return content
+# The data files are small and static, so they are read once when the module is imported
+# and requests are served from memory.
+_ARTICLES = _load_entries(ARTICLES_FILE)
+_ARTICLES_BY_ID = {article["id"]: article for article in _ARTICLES}
+_ARTICLE_CONTENTS = {path.stem: path.read_text(encoding="utf-8") for path in (DATA_DIR / "articles").glob("*.md")}
+_EVENTS = _load_entries(EVENTS_FILE)
+# The list endpoints never change, so their bodies are serialized once as well
+_ARTICLES_JSON = orjson.dumps({"articles": _ARTICLES})
+_EVENTS_JSON = orjson.dumps({"events": _EVENTS})
 
 
 @router.get("/articles")
-async def get_articles() -> dict[str, Any]:
+async def get_articles() -> Response:
     """Get all articles."""
-    articles = await _load_articles()
-    return {"articles": articles}
+    return Response(content=_ARTICLES_JSON, media_type="application/json")
 
 
 @router.get("/articles/{article_id}")
 async def get_article(article_id: str) -> dict[str, Any]:
     """Get a single article by ID with full content."""
-    article = await _get_article_by_id(article_id)
+    article = _ARTICLES_BY_ID.get(article_id)
 
     if not article:
         raise HTTPException(status_code=404, detail=f"Article {article_id} not found")
 
-    # Load full content
-    content = await _load_article_content(article_id)
-
     # Return article with content
     return {
         **article,
-        "content": content,
+        "content": _ARTICLE_CONTENTS.get(article_id, ""),
     }
 
 
 @router.get("/events")
-async def get_events() -> dict[str, Any]:
+async def get_events() -> Response:
     """Get all events."""
-    async with aiofiles.open(EVENTS_FILE, "r", encoding="utf-8") as f:
-        content = await f.read()
-        events = json.loads(content)
-
-    # events.json is a list directly, not {"events": [...]}
-    return {"events": events if isinstance(events, list) else []}
+    return Response(content=_EVENTS_JSON, media_type="application/json")
 
 
 @router.post("/chatkit")
@@ -110,12 +76,11 @@ async def chatkit_endpoint(
     request: Request,
     settings: FromDishka[Settings],
     request_server: FromDishka[NewsChatKitServer],
+    user_id: str = Depends(current_user_id),
 ) -> Response:
     """ChatKit endpoint for news assistant."""
     payload = await request.body()
 
-    user_id = "ksachdeva-1"
-
     # Extract article-id from request headers
     article_id = request.headers.get("article-id")
 
@@ -1,39 +1,44 @@
+import logging
 from typing import Any
 
-from adk_chatkit import ADKContext
 from chatkit.server import StreamingResult
 from dishka.integrations.fastapi import (
     DishkaRoute,
     FromDishka,
 )
-from fastapi import APIRouter, Query, Request
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import Response, StreamingResponse
 from google.adk.sessions.base_session_service import BaseSessionService
 from starlette.responses import JSONResponse
 
 from backend._config import Settings
 from backend.agents.airline import AirlineAgentContext, AirlineSupportChatKitServer
+from backend.api._auth import current_user_id, request_context
+
+_LOGGER = logging.getLogger(__name__)
 
 router = APIRouter(route_class=DishkaRoute)
 
+# Profile returned before a thread exists; it is only serialized, never mutated
+_INITIAL_CUSTOMER_PROFILE = AirlineAgentContext.create_initial_context().model_dump()["customer_profile"]
+
 
 @router.post("/chatkit")
 async def chatkit_endpoint(
     request: Request,
     settings: FromDishka[Settings],
     request_server: FromDishka[AirlineSupportChatKitServer],
+    user_id: str = Depends(current_user_id),
 ) -> Response:
     payload = await request.body()
-    print("Received payload:", payload)
-
-    user_id = "ksachdeva-1"
+    _LOGGER.debug("Received chatkit payload (%d bytes)", len(payload))
 
     result = await request_server.process(
         payload,
-        ADKContext(user_id=user_id, app_name=settings.AIRLINE_APP_NAME),
+        request_context(user_id, settings.AIRLINE_APP_NAME),
     )
 
-    print(result)
+    _LOGGER.debug("ChatKit result: %s", type(result).__name__)
 
     if isinstance(result, StreamingResult):
         return StreamingResponse(result, media_type="text/event-stream")
@@ -52,14 +57,10 @@ async def customer_snapshot(
     session_service: FromDishka[BaseSessionService],
     settings: FromDishka[Settings],
     thread_id: str | None = Query(None, description="ChatKit thread identifier"),
+    user_id: str = Depends(current_user_id),
 ) -> dict[str, Any]:
-    # hard coded user id for now
-    # as not doing an authentication
-    user_id = "ksachdeva-1"
-
     if not thread_id:
-        context = AirlineAgentContext.create_initial_context().model_dump()
-        return {"customer": context["customer_profile"]}
+        return {"customer": _INITIAL_CUSTOMER_PROFILE}
 
     session = await session_service.get_session(
         app_name=settings.AIRLINE_APP_NAME,
@@ -1,42 +1,44 @@
-from adk_chatkit import ADKContext
+import logging
+
 from chatkit.server import StreamingResult
 from dishka.integrations.fastapi import (
     DishkaRoute,
     FromDishka,
 )
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import Response, StreamingResponse
-from starlette.responses import JSONResponse
 
-from backend._config import Settings
 from backend.agents.widgets import WidgetsChatKitServer
+from backend.api._auth import current_user_id, request_context
+
+_LOGGER = logging.getLogger(__name__)
 
 router = APIRouter(route_class=DishkaRoute)
 
+# Keep reverse proxies from buffering the event stream so each event reaches the client as it is produced
+_SSE_HEADERS = {"X-Accel-Buffering": "no", "Cache-Control": "no-cache"}
+
 
 @router.post("/chatkit")
 async def chatkit_endpoint(
     request: Request,
-    settings: FromDishka[Settings],
     request_server: FromDishka[WidgetsChatKitServer],
+    user_id: str = Depends(current_user_id),
 ) -> Response:
     payload = await request.body()
-    print("Received payload:", payload)
-
-    user_id = "ksachdeva-1"
+    _LOGGER.debug("Received chatkit payload (%d bytes)", len(payload))
 
     result = await request_server.process(
         payload,
-        ADKContext(user_id=user_id, app_name=settings.WIDGETS_APP_NAME),
+        request_context(user_id, request_server.app_name),
     )
 
-    print(result)
+    _LOGGER.debug("ChatKit result: %s", type(result).__name__)
 
     if isinstance(result, StreamingResult):
-        return StreamingResponse(result, media_type="text/event-stream")
-    if hasattr(result, "json"):
-        return Response(content=result.json, media_type="application/json")
-    return JSONResponse(result)
+        return StreamingResponse(result, media_type="text/event-stream", headers=_SSE_HEADERS)
+    # process() returns either a streaming or a non-streaming result, and the latter is already encoded JSON
+    return Response(content=result.json, media_type="application/json")
 
 
 @router.get("/health", summary="Check health of facts agent")
@@ -1,10 +1,11 @@
 import os
+from functools import cache
+from typing import Any
 
-from google.adk.models.lite_llm import LiteLlm
+from google.adk.agents import BaseAgent
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from backend.agents import AgentConfig
-from backend.agents.airline import AirlineSupportAgent
 
 
 class Settings(BaseSettings):
@@ -17,12 +18,23 @@ class Settings(BaseSettings):
     gpt41_agent: AgentConfig
 
 
-_settings = Settings()  # type: ignore
+@cache
+def _root_agent() -> BaseAgent:
+    # Imported here so loading the package stays cheap until the agent is first used
+    from google.adk.models.lite_llm import LiteLlm
 
+    from backend.agents.airline import AirlineSupportAgent
 
-_airline_support_agent_config = _settings.gpt41_agent
+    settings = Settings()  # type: ignore
+    agent_config = settings.gpt41_agent
 
-root_agent = AirlineSupportAgent(
-    llm=LiteLlm(model=_airline_support_agent_config.llm.model_name, **_airline_support_agent_config.llm.provider_args),
-    generate_content_config=_airline_support_agent_config.generate_content,
-)
+    return AirlineSupportAgent(
+        llm=LiteLlm(model=agent_config.llm.model_name, **agent_config.llm.provider_args),
+        generate_content_config=agent_config.generate_content,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    if name == "root_agent":
+        return _root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
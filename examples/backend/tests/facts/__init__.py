@@ -1,10 +1,11 @@
 import os
+from functools import cache
+from typing import Any
 
-from google.adk.models.lite_llm import LiteLlm
+from google.adk.agents import BaseAgent
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from backend.agents import AgentConfig
-from backend.agents.facts import FactsAgent
 
 
 class Settings(BaseSettings):
@@ -17,12 +18,23 @@ class Settings(BaseSettings):
     gpt41_agent: AgentConfig
 
 
-_settings = Settings()  # type: ignore
+@cache
+def _root_agent() -> BaseAgent:
+    # Imported here so loading the package stays cheap until the agent is first used
+    from google.adk.models.lite_llm import LiteLlm
 
+    from backend.agents.facts import FactsAgent
 
-_facts_agent_config = _settings.gpt41_agent
+    settings = Settings()  # type: ignore
+    agent_config = settings.gpt41_agent
 
-root_agent = FactsAgent(
-    llm=LiteLlm(model=_facts_agent_config.llm.model_name, **_facts_agent_config.llm.provider_args),
-    generate_content_config=_facts_agent_config.generate_content,
-)
+    return FactsAgent(
+        llm=LiteLlm(model=agent_config.llm.model_name, **agent_config.llm.provider_args),
+        generate_content_config=agent_config.generate_content,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    if name == "root_agent":
+        return _root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")